@@ -4,10 +4,15 @@
 # Operation Classes    #
 ########################
 
+import sys
+import warnings
 from abc import ABC, abstractmethod
-from decimal import Decimal
-from typing import Dict
+from decimal import Context, Decimal
+from typing import Callable, Dict, Protocol
+import numpy as np
+from numpy.typing import ArrayLike
 from app.exceptions import ValidationError
+from app.operations._kernels import _as_operands, _get_kernel
 
 """
 Module: operations.py
@@ -128,6 +133,36 @@ def divide(a: Number, b: Number) -> float:
     result = a / b
     return result
 
+# Default number of significant digits for Operation arithmetic. A calculator
+# displays at most ~15 digits, so the decimal module's 28-digit default only
+# makes every coefficient longer than needed.
+DEFAULT_PRECISION = 16
+
+# Private arithmetic context used by the Operation primitives. Using its
+# methods directly avoids both touching the thread's global context and the
+# cost of entering a localcontext() on every call.
+_CONTEXT = Context(prec=DEFAULT_PRECISION)
+
+# Operation primitives called by Operation.execute without a validation hook
+# indirection; Division.execute validates before calling _div
+_add = _CONTEXT.add
+_sub = _CONTEXT.subtract
+_mul = _CONTEXT.multiply
+_div = _CONTEXT.divide
+
+def set_precision(precision: int) -> None:
+    """
+    Set the number of significant digits used by Operation arithmetic.
+
+    Args:
+        precision (int): Significant digits (DEFAULT_PRECISION is 16).
+
+    Raises:
+        TypeError: If precision is not an integer.
+        ValueError: If precision is out of the decimal module's valid range.
+    """
+    _CONTEXT.prec = precision
+
 class Operation(ABC):
     """
     Abstract base class for calculator operations.
@@ -136,6 +171,9 @@ class Operation(ABC):
     implement the execute method and can optionally override operand validation.
     """
 
+    # Operations carry no per-instance state
+    __slots__ = ()
+
     @abstractmethod
     def execute(self, a: Decimal, b: Decimal) -> Decimal:
         """
@@ -171,6 +209,32 @@ class Operation(ABC):
         """
         pass
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        """
+        Record the subclass name once for use by __str__.
+
+        Also warns when a subclass overrides validate_operands but its execute
+        never calls it, since execute is no longer routed through the hook. An
+        execute that is not a Python function (e.g. a bound C primitive) cannot
+        call it and always warns.
+
+        Args:
+            **kwargs: Forwarded to the parent implementation.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._name = cls.__name__
+
+        if 'validate_operands' in cls.__dict__:
+            code = getattr(cls.execute, '__code__', None)
+            if code is None or 'validate_operands' not in code.co_names:
+                warnings.warn(
+                    f"{cls.__name__} overrides validate_operands but its execute "
+                    "does not call it",
+                    # Skip this hook and ABCMeta.__new__ to point at the
+                    # subclass's class statement
+                    stacklevel=3,
+                )
+
     def __str__(self) -> str:
         """
         Return operation name for display.
@@ -180,7 +244,7 @@ class Operation(ABC):
         Returns:
             str: Name of the operation.
         """
-        return self.__class__.__name__
+        return self._name
 
 
 class Addition(Operation):
@@ -190,6 +254,8 @@ class Addition(Operation):
     Performs the addition of two numbers.
     """
 
+    __slots__ = ()
+
     def execute(self, a: Decimal, b: Decimal) -> Decimal:
         """
         Add two numbers.
@@ -201,8 +267,20 @@ class Addition(Operation):
         Returns:
             Decimal: Sum of the two operands.
         """
-        self.validate_operands(a, b)
-        return a + b
+        return _add(a, b)
+
+    def execute_many(self, a: ArrayLike, b: ArrayLike) -> np.ndarray:
+        """
+        Add two batches of numbers element-wise.
+
+        Args:
+            a (array-like): First operand batch.
+            b (array-like): Second operand batch.
+
+        Returns:
+            numpy.ndarray: float64 sums of the paired operands.
+        """
+        return _get_kernel('add')(*_as_operands(a, b))
 
 
 class Subtraction(Operation):
@@ -212,6 +290,8 @@ class Subtraction(Operation):
     Performs the subtraction of one number from another.
     """
 
+    __slots__ = ()
+
     def execute(self, a: Decimal, b: Decimal) -> Decimal:
         """
         Subtract one number from another.
@@ -223,8 +303,20 @@ class Subtraction(Operation):
         Returns:
             Decimal: Difference between the two operands.
         """
-        self.validate_operands(a, b)
-        return a - b
+        return _sub(a, b)
+
+    def execute_many(self, a: ArrayLike, b: ArrayLike) -> np.ndarray:
+        """
+        Subtract two batches of numbers element-wise.
+
+        Args:
+            a (array-like): First operand batch.
+            b (array-like): Second operand batch.
+
+        Returns:
+            numpy.ndarray: float64 differences of the paired operands.
+        """
+        return _get_kernel('subtract')(*_as_operands(a, b))
 
 
 class Multiplication(Operation):
@@ -234,6 +326,8 @@ class Multiplication(Operation):
     Performs the multiplication of two numbers.
     """
 
+    __slots__ = ()
+
     def execute(self, a: Decimal, b: Decimal) -> Decimal:
         """
         Multiply two numbers.
@@ -245,8 +339,20 @@ class Multiplication(Operation):
         Returns:
             Decimal: Product of the two operands.
         """
-        self.validate_operands(a, b)
-        return a * b
+        return _mul(a, b)
+
+    def execute_many(self, a: ArrayLike, b: ArrayLike) -> np.ndarray:
+        """
+        Multiply two batches of numbers element-wise.
+
+        Args:
+            a (array-like): First operand batch.
+            b (array-like): Second operand batch.
+
+        Returns:
+            numpy.ndarray: float64 products of the paired operands.
+        """
+        return _get_kernel('multiply')(*_as_operands(a, b))
 
 
 class Division(Operation):
@@ -256,6 +362,8 @@ class Division(Operation):
     Performs the division of one number by another.
     """
 
+    __slots__ = ()
+
     def validate_operands(self, a: Decimal, b: Decimal) -> None:
         """
         Validate operands, checking for division by zero.
@@ -285,7 +393,161 @@ class Division(Operation):
             Decimal: Quotient of the division.
         """
         self.validate_operands(a, b)
-        return a / b
+        return _div(a, b)
+
+    def execute_many(self, a: ArrayLike, b: ArrayLike) -> np.ndarray:
+        """
+        Divide two batches of numbers element-wise.
+
+        Args:
+            a (array-like): Dividend batch.
+            b (array-like): Divisor batch.
+
+        Returns:
+            numpy.ndarray: float64 quotients of the paired operands.
+
+        Raises:
+            ValidationError: If any divisor is zero.
+        """
+        a, b = _as_operands(a, b)
+        if (b == 0).any():
+            raise ValidationError("Division by zero is not allowed")
+        return _get_kernel('divide')(a, b)
+
+# Operands accepted by FloatOperation; anything float() can convert
+FloatOperand = Union[Decimal, Number]
+
+class FloatOperation(Operation):
+    """
+    Abstract base class for float64 calculator operations.
+
+    Float operations convert both operands with float() and return a float.
+    This is much faster than Decimal arithmetic but inherits binary floating
+    point's accuracy limits: results carry roughly 15-17 significant digits
+    and decimal fractions are not exact (e.g. 0.1 + 0.2 != 0.3). Use the
+    Decimal operations when exact decimal results matter.
+    """
+
+    __slots__ = ()
+
+
+class FastAddition(FloatOperation):
+    """
+    Float addition operation implementation.
+    """
+
+    __slots__ = ()
+
+    def execute(self, a: FloatOperand, b: FloatOperand) -> float:
+        """
+        Add two numbers as floats.
+
+        Args:
+            a (FloatOperand): First operand.
+            b (FloatOperand): Second operand.
+
+        Returns:
+            float: Sum of the two operands.
+        """
+        return float(a) + float(b)
+
+
+class FastSubtraction(FloatOperation):
+    """
+    Float subtraction operation implementation.
+    """
+
+    __slots__ = ()
+
+    def execute(self, a: FloatOperand, b: FloatOperand) -> float:
+        """
+        Subtract one number from another as floats.
+
+        Args:
+            a (FloatOperand): First operand.
+            b (FloatOperand): Second operand.
+
+        Returns:
+            float: Difference between the two operands.
+        """
+        return float(a) - float(b)
+
+
+class FastMultiplication(FloatOperation):
+    """
+    Float multiplication operation implementation.
+    """
+
+    __slots__ = ()
+
+    def execute(self, a: FloatOperand, b: FloatOperand) -> float:
+        """
+        Multiply two numbers as floats.
+
+        Args:
+            a (FloatOperand): First operand.
+            b (FloatOperand): Second operand.
+
+        Returns:
+            float: Product of the two operands.
+        """
+        return float(a) * float(b)
+
+
+class FastDivision(FloatOperation):
+    """
+    Float division operation implementation.
+    """
+
+    __slots__ = ()
+
+    def validate_operands(self, a: FloatOperand, b: FloatOperand) -> None:
+        """
+        Validate operands, checking for division by zero.
+
+        Overrides the base class method to ensure that the divisor is not zero.
+
+        Args:
+            a (FloatOperand): Dividend.
+            b (FloatOperand): Divisor.
+
+        Raises:
+            ValidationError: If the divisor is zero.
+        """
+        super().validate_operands(a, b)
+        if b == 0:
+            raise ValidationError("Division by zero is not allowed")
+
+    def execute(self, a: FloatOperand, b: FloatOperand) -> float:
+        """
+        Divide one number by another as floats.
+
+        Args:
+            a (FloatOperand): Dividend.
+            b (FloatOperand): Divisor.
+
+        Returns:
+            float: Quotient of the division.
+        """
+        self.validate_operands(a, b)
+        return float(a) / float(b)
+
+# Result of any registered operation: Decimal for the built-in Decimal
+# operations, float for the FloatOperation family
+OperationResult = Union[Decimal, float]
+
+class SupportsExecute(Protocol):
+    """
+    Structural type for anything OperationFactory can hand out.
+
+    Built-in operations are Operation subclasses, but register_operation also
+    accepts any class with a callable execute method. Only execute is
+    guaranteed; __str__ naming and validate_operands come from Operation.
+    """
+
+    def execute(self, a: FloatOperand, b: FloatOperand) -> OperationResult:
+        ...  # pragma: no cover
+
 
 class OperationFactory:
     """
@@ -302,6 +564,16 @@ class OperationFactory:
         'subtract': Subtraction,
         'multiply': Multiplication,
         'divide': Division,
+        'fadd': FastAddition,
+        'fsub': FastSubtraction,
+        'fmul': FastMultiplication,
+        'fdiv': FastDivision,
+    }
+
+    # Operations are stateless, so a single shared instance per identifier is
+    # created up front and handed out by create_operation
+    _instances: Dict[str, SupportsExecute] = {
+        name: operation_class() for name, operation_class in _operations.items()
     }
 
     @classmethod
@@ -316,30 +588,66 @@ class OperationFactory:
             operation_class (type): The class implementing the new operation.
 
         Raises:
-            TypeError: If the operation_class does not inherit from Operation.
+            TypeError: If operation_class is not a class, has no callable
+                execute method, or cannot be instantiated.
         """
-        if not issubclass(operation_class, Operation):
-            raise TypeError("Operation class must inherit from Operation")
-        cls._operations[name.lower()] = operation_class
+        if not isinstance(operation_class, type):
+            raise TypeError("Operation class must be a class, not an instance")
+        # Duck-typed check: cheaper than issubclass() through ABCMeta and
+        # accepts any class satisfying SupportsExecute
+        if not callable(getattr(operation_class, 'execute', None)):
+            raise TypeError("Operation class must implement a callable execute method")
+        name = sys.intern(name.lower())
+        # Instantiate before touching either registry so a failing constructor
+        # (e.g. an abstract class) leaves no half-registered name behind
+        instance = operation_class()
+        cls._operations[name] = operation_class
+        cls._instances[name] = instance
 
     @classmethod
-    def create_operation(cls, operation_type: str) -> Operation:
+    def create_operation(cls, operation_type: str) -> SupportsExecute:
         """
         Create an operation instance based on the operation type.
 
-        This method retrieves the appropriate operation class from the
-        _operations dictionary and instantiates it.
+        This method returns the shared instance of the appropriate operation
+        class from the instance registry.
 
         Args:
             operation_type (str): The type of operation to create (e.g., 'add').
 
         Returns:
-            Operation: An instance of the specified operation class.
+            SupportsExecute: The shared instance of the specified operation
+            class; an Operation for every built-in type.
 
         Raises:
             ValueError: If the operation type is unknown.
         """
-        operation_class = cls._operations.get(operation_type.lower())
-        if not operation_class:
+        # Canonical lowercase names hit the dict directly; only fall back to
+        # .lower() (and its string allocation) when the exact lookup misses
+        operation = cls._instances.get(operation_type)
+        if operation is None:
+            operation = cls._instances.get(operation_type.lower())
+        if operation is None:
             raise ValueError(f"Unknown operation: {operation_type}")
-        return operation_class()
+        return operation
+
+    @classmethod
+    def get_callable(
+        cls, operation_type: str
+    ) -> Callable[[FloatOperand, FloatOperand], OperationResult]:
+        """
+        Return the callable that performs an operation.
+
+        Lets hot loops call ``op(a, b)`` directly instead of going through
+        ``operation.execute(a, b)``.
+
+        Args:
+            operation_type (str): The type of operation (e.g., 'add').
+
+        Returns:
+            Callable: A function taking two operands and returning the result.
+
+        Raises:
+            ValueError: If the operation type is unknown.
+        """
+        return cls.create_operation(operation_type).execute
@@ -0,0 +1,124 @@
+# app/operations/_kernels.py
+
+########################
+# Batch Kernels        #
+########################
+
+"""
+Module: _kernels.py
+
+Batch kernels used by the ``execute_many`` batch entry points of the
+Operation classes. Each kernel takes two equal-length float64 arrays and returns
+a new float64 array holding the element-wise result.
+
+The scalar ``execute`` methods stay on Decimal for precision; these kernels are
+meant for bulk workloads where float64 is acceptable and per-element Python
+dispatch would dominate.
+
+Kernels are compiled lazily with Numba on the first ``execute_many`` call, so
+importing the operations package pays no JIT cost; compiled code is cached on
+disk for later processes. Without Numba the equivalent NumPy ufuncs are used.
+"""
+
+from typing import Callable, Dict, Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+# LLVM fast-math flags minus 'nnan' and 'ninf': operands are not checked for
+# NaN or infinity, so the kernels must not assume they are absent
+_FASTMATH = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+
+
+def _add_loop(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    out = np.empty_like(a)
+    for i in range(a.shape[0]):
+        out[i] = a[i] + b[i]
+    return out
+
+
+def _sub_loop(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    out = np.empty_like(a)
+    for i in range(a.shape[0]):
+        out[i] = a[i] - b[i]
+    return out
+
+
+def _mul_loop(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    out = np.empty_like(a)
+    for i in range(a.shape[0]):
+        out[i] = a[i] * b[i]
+    return out
+
+
+def _div_loop(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    out = np.empty_like(a)
+    for i in range(a.shape[0]):
+        out[i] = a[i] / b[i]
+    return out
+
+
+_LOOPS = {
+    'add': _add_loop,
+    'subtract': _sub_loop,
+    'multiply': _mul_loop,
+    'divide': _div_loop,
+}
+
+_UFUNCS = {
+    'add': np.add,
+    'subtract': np.subtract,
+    'multiply': np.multiply,
+    'divide': np.true_divide,
+}
+
+# Populated on the first _get_kernel call
+_kernels: Dict[str, Callable[[np.ndarray, np.ndarray], np.ndarray]] = {}
+
+
+def _get_kernel(name: str) -> Callable[[np.ndarray, np.ndarray], np.ndarray]:
+    """
+    Return the batch kernel for an operation, building all kernels on first use.
+
+    Args:
+        name (str): One of 'add', 'subtract', 'multiply', 'divide'.
+
+    Returns:
+        Callable: A function taking two float64 arrays and returning their
+        element-wise result.
+    """
+    kernel = _kernels.get(name)
+    if kernel is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _kernels.update(_UFUNCS)
+        else:
+            _kernels.update({
+                key: njit(cache=True, fastmath=_FASTMATH)(loop)
+                for key, loop in _LOOPS.items()
+            })
+        kernel = _kernels[name]
+    return kernel
+
+
+def _as_operands(a: ArrayLike, b: ArrayLike) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Coerce two batch operands to contiguous float64 arrays of equal length.
+
+    Args:
+        a: First operand batch (array-like).
+        b: Second operand batch (array-like).
+
+    Returns:
+        tuple: The two operands as 1-D float64 ndarrays.
+
+    Raises:
+        ValueError: If the operands are not 1-D or differ in length.
+    """
+    # Check dimensions before ascontiguousarray, which promotes scalars to 1-D
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    if a.ndim != 1 or b.ndim != 1 or a.shape != b.shape:
+        raise ValueError("Operands must be 1-D arrays of equal length")
+    return np.ascontiguousarray(a), np.ascontiguousarray(b)
@@ -1,18 +1,36 @@
+import sys
+import numpy as np
 import pytest
 from decimal import Decimal
 from typing import Any, Dict, Type
 
 from app.exceptions import ValidationError
+from app.operations import _kernels as kernels
 from app.operations import (
     Operation,
     Addition,
     Subtraction,
     Multiplication,
     Division,
+    FastAddition,
+    FastSubtraction,
+    FastMultiplication,
+    FastDivision,
     OperationFactory,
+    DEFAULT_PRECISION,
+    set_precision,
 )
 
 
+def pytest_generate_tests(metafunc):
+    """Parametrize BaseOperationTest cases so each one is its own test node."""
+    for fixture, attr in (("valid_case", "valid_test_cases"),
+                          ("invalid_case", "invalid_test_cases")):
+        if metafunc.cls is not None and fixture in metafunc.fixturenames:
+            cases = getattr(metafunc.cls, attr)
+            metafunc.parametrize(fixture, list(cases.values()), ids=list(cases))
+
+
 class TestOperation:
     """Test base Operation class functionality."""
 
@@ -24,35 +42,87 @@ class TestOperation:
 
         assert str(TestOp()) == "TestOp"
 
+    @pytest.mark.parametrize("operation_class", [
+        Addition, Subtraction, Multiplication, Division,
+    ])
+    def test_instances_have_no_dict(self, operation_class):
+        """Test operations use empty __slots__ instead of a per-instance dict."""
+        operation = operation_class()
+        assert not hasattr(operation, "__dict__")
+        with pytest.raises(AttributeError):
+            operation.state = 1
+
+    @pytest.mark.parametrize("operation_class, expected", [
+        (Addition, Decimal("3")),
+        (Subtraction, Decimal("-1")),
+        (Multiplication, Decimal("2")),
+        (Division, Decimal("0.5")),
+    ])
+    def test_execute_accepts_keywords(self, operation_class, expected):
+        """Test execute can be called with keyword operands."""
+        assert operation_class().execute(a=Decimal("1"), b=Decimal("2")) == expected
+
+    def test_unused_validate_operands_warns(self):
+        """Test overriding validate_operands without calling it warns."""
+        with pytest.warns(UserWarning, match="does not call it") as record:
+            class UncheckedOp(Operation):
+                def validate_operands(self, a: Decimal, b: Decimal) -> None:
+                    raise ValidationError("never reached")
+
+                def execute(self, a: Decimal, b: Decimal) -> Decimal:
+                    return a
+
+        assert record[0].filename == __file__
+
+    def test_inherited_primitive_execute_warns(self):
+        """Test a validator added to an operation with a C-level execute warns."""
+        with pytest.warns(UserWarning, match="does not call it"):
+            class PositiveAddition(Addition):
+                def validate_operands(self, a: Decimal, b: Decimal) -> None:
+                    raise ValidationError("never reached")
+
 
 class BaseOperationTest:
     """Base test class for all operations."""
 
     operation_class: Type[Operation]
     valid_test_cases: Dict[str, Dict[str, Any]]
-    invalid_test_cases: Dict[str, Dict[str, Any]]
-
-    def test_valid_operations(self):
+    invalid_test_cases: Dict[str, Dict[str, Any]] = {}
+
+    _decimal_keys = ("a", "b", "expected")
+
+    def __init_subclass__(cls, **kwargs):
+        """Convert each case's numeric strings to Decimal once per subclass."""
+        super().__init_subclass__(**kwargs)
+        for attr in ("valid_test_cases", "invalid_test_cases"):
+            if attr not in cls.__dict__:
+                continue
+            setattr(cls, attr, {
+                name: {
+                    key: Decimal(value) if key in cls._decimal_keys else value
+                    for key, value in case.items()
+                }
+                for name, case in getattr(cls, attr).items()
+            })
+
+    def test_valid_operations(self, valid_case):
         """Test operation with valid inputs."""
         operation = self.operation_class()
-        for name, case in self.valid_test_cases.items():
-            a = Decimal(str(case["a"]))
-            b = Decimal(str(case["b"]))
-            expected = Decimal(str(case["expected"]))
-            result = operation.execute(a, b)
-            assert result == expected, f"Failed case: {name}"
-
-    def test_invalid_operations(self):
+        result = operation.execute(valid_case["a"], valid_case["b"])
+        assert result == valid_case["expected"]
+
+
+class BaseInvalidOperationTest(BaseOperationTest):
+    """Base test class for operations that also have invalid inputs."""
+
+    def test_invalid_operations(self, invalid_case):
         """Test operation with invalid inputs raises appropriate errors."""
         operation = self.operation_class()
-        for name, case in self.invalid_test_cases.items():
-            a = Decimal(str(case["a"]))
-            b = Decimal(str(case["b"]))
-            error = case.get("error", ValidationError)
-            error_message = case.get("message", "")
+        error = invalid_case.get("error", ValidationError)
+        error_message = invalid_case.get("message", "")
 
-            with pytest.raises(error, match=error_message):
-                operation.execute(a, b)
+        with pytest.raises(error, match=error_message):
+            operation.execute(invalid_case["a"], invalid_case["b"])
 
 
 class TestAddition(BaseOperationTest):
@@ -71,7 +141,6 @@ class TestAddition(BaseOperationTest):
             "expected": "20000000000"
         },
     }
-    invalid_test_cases = {}  # Addition has no invalid cases
 
 
 class TestSubtraction(BaseOperationTest):
@@ -90,7 +159,6 @@ class TestSubtraction(BaseOperationTest):
             "expected": "9000000000"
         },
     }
-    invalid_test_cases = {}  # Subtraction has no invalid cases
 
 
 class TestMultiplication(BaseOperationTest):
@@ -109,10 +177,9 @@ class TestMultiplication(BaseOperationTest):
             "expected": "10000000000"
         },
     }
-    invalid_test_cases = {}  # Multiplication has no invalid cases
 
 
-class TestDivision(BaseOperationTest):
+class TestDivision(BaseInvalidOperationTest):
     """Test Division operation."""
 
     operation_class = Division
@@ -132,10 +199,165 @@ class TestDivision(BaseOperationTest):
         },
     }
 
+    def test_int_zero_divisor(self):
+        """Test a plain int zero divisor raises ValidationError."""
+        with pytest.raises(ValidationError, match="Division by zero is not allowed"):
+            Division().execute(Decimal("1"), 0)
+
+
+class TestPrecision:
+    """Test the precision of Operation arithmetic."""
+
+    def test_default_precision(self):
+        """Test results are rounded to DEFAULT_PRECISION significant digits."""
+        result = Division().execute(Decimal("1"), Decimal("3"))
+        assert result == Decimal("0." + "3" * DEFAULT_PRECISION)
+
+    def test_set_precision(self):
+        """Test set_precision changes rounding of subsequent results."""
+        try:
+            set_precision(4)
+            assert Division().execute(Decimal("2"), Decimal("3")) == Decimal("0.6667")
+        finally:
+            set_precision(DEFAULT_PRECISION)
+
+    def test_set_invalid_precision(self):
+        """Test an out-of-range precision is rejected."""
+        with pytest.raises(ValueError):
+            set_precision(0)
+
+
+class TestFastAddition(BaseOperationTest):
+    """Test FastAddition operation."""
+
+    operation_class = FastAddition
+    valid_test_cases = {
+        "positive_numbers": {"a": "5", "b": "3", "expected": "8"},
+        "mixed_signs": {"a": "-5", "b": "3", "expected": "-2"},
+        "decimals": {"a": "5.5", "b": "2.25", "expected": "7.75"},
+    }
+
+    def test_binary_float_inexactness(self):
+        """Test results carry binary floating point error, unlike Addition."""
+        result = FastAddition().execute(Decimal("0.1"), Decimal("0.2"))
+        assert isinstance(result, float)
+        assert result != 0.3
+        assert result == 0.30000000000000004
+
+
+class TestFastSubtraction(BaseOperationTest):
+    """Test FastSubtraction operation."""
+
+    operation_class = FastSubtraction
+    valid_test_cases = {
+        "positive_numbers": {"a": "5", "b": "3", "expected": "2"},
+        "mixed_signs": {"a": "-5", "b": "3", "expected": "-8"},
+        "decimals": {"a": "5.5", "b": "2.25", "expected": "3.25"},
+    }
+
+
+class TestFastMultiplication(BaseOperationTest):
+    """Test FastMultiplication operation."""
+
+    operation_class = FastMultiplication
+    valid_test_cases = {
+        "positive_numbers": {"a": "5", "b": "3", "expected": "15"},
+        "mixed_signs": {"a": "-5", "b": "3", "expected": "-15"},
+        "decimals": {"a": "5.5", "b": "2", "expected": "11"},
+    }
+
+
+class TestFastDivision(BaseInvalidOperationTest):
+    """Test FastDivision operation."""
+
+    operation_class = FastDivision
+    valid_test_cases = {
+        "positive_numbers": {"a": "6", "b": "2", "expected": "3"},
+        "mixed_signs": {"a": "-6", "b": "2", "expected": "-3"},
+        "decimals": {"a": "5.5", "b": "2", "expected": "2.75"},
+    }
+    invalid_test_cases = {
+        "divide_by_zero": {
+            "a": "5",
+            "b": "0",
+            "error": ValidationError,
+            "message": "Division by zero is not allowed"
+        },
+    }
+
+    def test_validate_operands(self):
+        """Test validate_operands enforces the zero-divisor rule directly."""
+        with pytest.raises(ValidationError, match="Division by zero is not allowed"):
+            FastDivision().validate_operands(1, 0)
+
+
+class TestExecuteMany:
+    """Test batch execution of operations."""
+
+    @pytest.mark.parametrize("operation_class, expected", [
+        (Addition, [5.0, 1.5, 0.0]),
+        (Subtraction, [1.0, 4.5, -10.0]),
+        (Multiplication, [6.0, -4.5, -25.0]),
+        (Division, [1.5, -2.0, -1.0]),
+    ])
+    def test_valid_batches(self, operation_class, expected):
+        """Test batch results match element-wise arithmetic."""
+        a = np.array([3.0, 3.0, -5.0])
+        b = np.array([2.0, -1.5, 5.0])
+        result = operation_class().execute_many(a, b)
+        assert isinstance(result, np.ndarray)
+        assert result.tolist() == expected
+
+    def test_accepts_sequences(self):
+        """Test plain sequences are coerced to float64 arrays."""
+        result = Addition().execute_many([1, 2], [3, 4])
+        assert result.dtype == np.float64
+        assert result.tolist() == [4.0, 6.0]
+
+    def test_non_finite_operands(self):
+        """Test NaN and infinity propagate through the batch kernels."""
+        result = Addition().execute_many([np.nan, np.inf], [1.0, 1.0])
+        assert np.isnan(result[0])
+        assert result[1] == np.inf
+
+    def test_scalar_operands_rejected(self):
+        """Test scalar operands are not silently promoted to 1-D batches."""
+        with pytest.raises(ValueError, match="1-D"):
+            Addition().execute_many(5.0, 3.0)
+
+    def test_numpy_fallback_without_numba(self, monkeypatch):
+        """Test the NumPy ufuncs are used when Numba cannot be imported."""
+        monkeypatch.setitem(sys.modules, "numba", None)
+        monkeypatch.setattr(kernels, "_kernels", {})
+        assert kernels._get_kernel("add") is np.add
+        result = Division().execute_many([3.0, 1.0], [2.0, 4.0])
+        assert result.tolist() == [1.5, 0.25]
+
+    def test_mismatched_lengths(self):
+        """Test operands of different lengths raise an error."""
+        with pytest.raises(ValueError, match="equal length"):
+            Addition().execute_many([1.0, 2.0], [1.0])
+
+    def test_divide_by_zero(self):
+        """Test any zero divisor in the batch raises ValidationError."""
+        with pytest.raises(ValidationError, match="Division by zero is not allowed"):
+            Division().execute_many([1.0, 2.0], [1.0, 0.0])
+
 
 class TestOperationFactory:
     """Test OperationFactory functionality."""
 
+    @pytest.fixture(autouse=True)
+    def restore_registry(self):
+        """Restore the factory's class-level registries after each test."""
+        operations = dict(OperationFactory._operations)
+        instances = dict(OperationFactory._instances)
+        yield
+        OperationFactory._operations.clear()
+        OperationFactory._operations.update(operations)
+        OperationFactory._instances.clear()
+        OperationFactory._instances.update(instances)
+
     def test_create_valid_operations(self):
         """Test creation of all valid operations."""
         operation_map = {
@@ -143,6 +365,10 @@ class TestOperationFactory:
             'subtract': Subtraction,
             'multiply': Multiplication,
             'divide': Division,
+            'fadd': FastAddition,
+            'fsub': FastSubtraction,
+            'fmul': FastMultiplication,
+            'fdiv': FastDivision,
         }
 
         for op_name, op_class in operation_map.items():
@@ -157,6 +383,22 @@ class TestOperationFactory:
         with pytest.raises(ValueError, match="Unknown operation: invalid_op"):
             OperationFactory.create_operation("invalid_op")
 
+    def test_create_operation_returns_shared_instance(self):
+        """Test repeated creation returns the same cached instance."""
+        first = OperationFactory.create_operation('add')
+        assert OperationFactory.create_operation('add') is first
+        assert OperationFactory.create_operation('ADD') is first
+
+    def test_get_callable(self):
+        """Test get_callable returns a plain function for each operation."""
+        add = OperationFactory.get_callable('add')
+        assert add(Decimal("2"), Decimal("3")) == Decimal("5")
+        divide = OperationFactory.get_callable('DIVIDE')
+        with pytest.raises(ValidationError, match="Division by zero is not allowed"):
+            divide(Decimal("1"), Decimal("0"))
+        with pytest.raises(ValueError, match="Unknown operation: invalid_op"):
+            OperationFactory.get_callable("invalid_op")
+
     def test_register_valid_operation(self):
         """Test registering a new valid operation."""
         class NewOperation(Operation):
@@ -167,10 +409,41 @@ class TestOperationFactory:
         operation = OperationFactory.create_operation("new_op")
         assert isinstance(operation, NewOperation)
 
+    def test_register_duck_typed_operation(self):
+        """Test registering a class that only provides execute."""
+        class DuckOperation:
+            def execute(self, a: Decimal, b: Decimal) -> Decimal:
+                return b
+
+        OperationFactory.register_operation("duck_op", DuckOperation)
+        operation = OperationFactory.create_operation("duck_op")
+        assert operation.execute(Decimal("1"), Decimal("2")) == Decimal("2")
+
+    def test_registry_restored_between_tests(self):
+        """Test operations registered by other tests do not leak."""
+        assert "duck_op" not in OperationFactory._operations
+        assert "new_op" not in OperationFactory._instances
+
+    def test_register_failed_construction(self):
+        """Test a class that cannot be instantiated is not registered at all."""
+        class AbstractOperation(Operation):
+            pass
+
+        with pytest.raises(TypeError):
+            OperationFactory.register_operation("abstract_op", AbstractOperation)
+        assert "abstract_op" not in OperationFactory._operations
+        assert "abstract_op" not in OperationFactory._instances
+
+    def test_register_instance_rejected(self):
+        """Test registering an instance instead of a class raises error."""
+        with pytest.raises(TypeError, match="must be a class"):
+            OperationFactory.register_operation("instance_op", Addition())
+        assert "instance_op" not in OperationFactory._operations
+
     def test_register_invalid_operation(self):
         """Test registering an invalid operation class raises error."""
         class InvalidOperation:
             pass
 
-        with pytest.raises(TypeError, match="Operation class must inherit"):
+        with pytest.raises(TypeError, match="Operation class must implement"):
             OperationFactory.register_operation("invalid", InvalidOperation)
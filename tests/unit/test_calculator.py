@@ -232,3 +232,13 @@ def test_divide_by_zero() -> None:
     # Assert that the exception message contains the expected error message
     assert "Cannot divide by zero!" in str(excinfo.value), \
         f"Expected error message 'Cannot divide by zero!', but got '{excinfo.value}'"
+
+
+def test_divide_float_by_zero() -> None:
+    """
+    Test the 'divide' function with a float divided by float zero.
+
+    Verifies that a float zero divisor raises the same ValueError as an integer zero.
+    """
+    with pytest.raises(ValueError, match="Cannot divide by zero!"):
+        divide(6.0, 0.0)